@@ -1,34 +1,195 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from collections.abc import Callable
 from pathlib import Path
+from typing import Final
 
 import asyncpg
+import orjson
 
-from app.config import DATABASE_URL
+from app.config import (
+    DATABASE_URL,
+    DB_COMMAND_TIMEOUT,
+    DB_POOL_INACTIVE_LIFETIME,
+    DB_POOL_MAX,
+    DB_POOL_MAX_QUERIES,
+    DB_POOL_MIN,
+    DB_STATEMENT_CACHE_SIZE,
+)
 
 log = logging.getLogger(__name__)
 
-pool: asyncpg.Pool | None = None
+_pool: asyncpg.Pool | None = None
+
+# Dedicated connection for LISTEN; kept outside the pool so it is never
+# recycled or counted against max_size.
+_listener: asyncpg.Connection | None = None
+_reconnect_task: asyncio.Task | None = None
+_notify_callbacks: dict[str, list[Callable[[], None]]] = {}
+
+# Arbitrary key for pg_advisory_xact_lock, shared by every worker process.
+_SCHEMA_LOCK_ID = 727272
+
+# Backoff bounds (seconds) for re-opening a dropped LISTEN connection.
+_LISTENER_RETRY_MIN = 1.0
+_LISTENER_RETRY_MAX = 60.0
+
+# Upper bound on waiting for in-flight queries at shutdown before terminating.
+_POOL_CLOSE_TIMEOUT = 10
+
+_SCHEMA_SQL: Final[str] = (Path(__file__).parent / "sql" / "schema.sql").read_text()
+_SCHEMA_HASH: Final[str] = hashlib.blake2b(_SCHEMA_SQL.encode(), digest_size=16).hexdigest()
 
 
 def get_pool() -> asyncpg.Pool:
-    assert pool is not None, "Database not initialized — call init_db() first"
-    return pool
+    # An explicit check rather than assert, which ``python -O`` strips.
+    p = _pool
+    if p is None:
+        raise RuntimeError("Database not initialized — call init_db() first")
+    return p
+
+
+def on_notify(channel: str, callback: Callable[[], None]) -> None:
+    """Call *callback* whenever any session issues ``NOTIFY <channel>``.
+
+    Register before ``init_db()``; the listener subscribes at startup.
+    """
+    _notify_callbacks.setdefault(channel, []).append(callback)
+
+
+def _dispatch_notify(conn, pid, channel, payload) -> None:
+    for callback in _notify_callbacks.get(channel, ()):
+        callback()
+
+
+def _json_dumps(obj) -> str:
+    # asyncpg's text codec wants str; orjson covers date/datetime and numpy
+    # scalars natively, str() is the fallback for anything else yfinance hands us.
+    return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+# Sent as startup parameters rather than SET in _init_connection: the pool
+# runs RESET ALL on release, which reverts SETs but not startup values.
+_SERVER_SETTINGS = {
+    # Our queries are short OLTP lookups; JIT compilation only adds latency.
+    "jit": "off",
+    # Day grouping (date::date) and JSON timestamps are built server-side;
+    # keep them in UTC whatever the server's TimeZone is.
+    "TimeZone": "UTC",
+}
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    # Hand JSON columns to/from Python objects instead of raw strings.
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename, encoder=_json_dumps, decoder=orjson.loads, schema="pg_catalog",
+        )
 
 
 async def init_db() -> None:
-    global pool
-    pool = await asyncpg.create_pool(DATABASE_URL, min_size=2, max_size=10)
-    schema = (Path(__file__).parent / "sql" / "schema.sql").read_text()
-    async with pool.acquire() as conn:
-        await conn.execute(schema)
+    global _pool
+    _pool = await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=DB_POOL_MIN,
+        max_size=DB_POOL_MAX,
+        max_queries=DB_POOL_MAX_QUERIES,
+        max_inactive_connection_lifetime=DB_POOL_INACTIVE_LIFETIME,
+        statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+        command_timeout=DB_COMMAND_TIMEOUT,
+        server_settings=_SERVER_SETTINGS,
+        init=_init_connection,
+    )
+    async with _pool.acquire() as conn:
+        async with conn.transaction():
+            # Only one worker at a time runs the DDL; the rest wait, then no-op.
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", _SCHEMA_LOCK_ID)
+            await conn.execute(
+                "CREATE TABLE IF NOT EXISTS schema_version ("
+                " hash TEXT PRIMARY KEY, applied_at TIMESTAMPTZ DEFAULT now())"
+            )
+            digest = _SCHEMA_HASH
+            if await conn.fetchval("SELECT 1 FROM schema_version WHERE hash = $1", digest):
+                log.info("Database schema %s already applied", digest)
+            else:
+                await conn.execute(_SCHEMA_SQL)
+                await conn.execute("INSERT INTO schema_version (hash) VALUES ($1)", digest)
+                log.info("Applied database schema %s", digest)
+    await _start_listener()
     log.info("Database initialized")
 
 
+async def _start_listener() -> None:
+    global _listener
+    if not _notify_callbacks:
+        return
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        for channel in _notify_callbacks:
+            await conn.add_listener(channel, _dispatch_notify)
+    except BaseException:
+        conn.terminate()
+        raise
+    conn.add_termination_listener(_on_listener_lost)
+    _listener = conn
+    log.info("Listening on %s", ", ".join(_notify_callbacks))
+
+
+def _on_listener_lost(conn: asyncpg.Connection) -> None:
+    global _listener, _reconnect_task
+    if conn is not _listener:
+        return  # closed on purpose by close_db()
+    _listener = None
+    log.warning("LISTEN connection lost; reconnecting")
+    _reconnect_task = asyncio.get_running_loop().create_task(_reconnect_listener())
+
+
+async def _reconnect_listener() -> None:
+    delay = _LISTENER_RETRY_MIN
+    while True:
+        try:
+            await _start_listener()
+        except Exception as exc:
+            log.warning("LISTEN reconnect failed (%s); retrying in %gs", exc, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _LISTENER_RETRY_MAX)
+            continue
+        # Notifications sent while we were disconnected are gone; assume the worst.
+        _dispatch_all()
+        log.info("LISTEN connection restored")
+        return
+
+
+def _dispatch_all() -> None:
+    for callbacks in _notify_callbacks.values():
+        for callback in callbacks:
+            callback()
+
+
 async def close_db() -> None:
-    global pool
-    if pool:
-        await pool.close()
-        pool = None
-        log.info("Database pool closed")
+    global _pool, _listener, _reconnect_task
+    if _reconnect_task:
+        _reconnect_task.cancel()
+        _reconnect_task = None
+    if _listener:
+        listener, _listener = _listener, None
+        await listener.close()
+    if _pool:
+        log.info(
+            "Closing database pool (size=%d, idle=%d, min=%d, max=%d)",
+            _pool.get_size(), _pool.get_idle_size(),
+            _pool.get_min_size(), _pool.get_max_size(),
+        )
+        try:
+            await asyncio.wait_for(_pool.close(), timeout=_POOL_CLOSE_TIMEOUT)
+            log.info("Database pool closed")
+        except TimeoutError:
+            log.warning(
+                "Database pool still busy after %ds; terminating connections",
+                _POOL_CLOSE_TIMEOUT,
+            )
+            _pool.terminate()
+        _pool = None
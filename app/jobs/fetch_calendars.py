@@ -5,33 +5,39 @@ import logging
 from datetime import date, datetime, timedelta
 
 import pandas as pd
+import pyarrow as pa
 import yfinance as yf
 import curl_cffi as curl
 
 from app.storage import write_earnings_calendar, write_economics_calendar
-from app.jobs.parsers.forexfactory import extract_calendar_table, parse_economic_calendar
+from app.jobs.parsers.forexfactory import parse_calendar_page
 
 log = logging.getLogger(__name__)
 
+# Shared across runs so the TLS session to ForexFactory is reused.
+_http: curl.AsyncSession | None = None
 
-def _nan_to_none(val):
-    if val is None:
-        return None
-    try:
-        if pd.isna(val):
-            return None
-    except (ValueError, TypeError):
-        pass
-    return val
+
+def _http_session() -> curl.AsyncSession:
+    global _http
+    if _http is None:
+        _http = curl.AsyncSession(impersonate="chrome")
+    return _http
+
+
+async def close_http_session() -> None:
+    global _http
+    if _http is not None:
+        await _http.close()
+        _http = None
 
 
 def _df_to_records(df: pd.DataFrame) -> list[dict]:
-    df = df.reset_index()
-    records = df.to_dict(orient="records")
-    return [
-        {k: _nan_to_none(v) for k, v in row.items()}
-        for row in records
-    ]
+    """Convert *df* (index included) to a list of row dicts with nulls as None.
+
+    Arrow converts column-wise in C and already maps NaN/NaT to None.
+    """
+    return pa.Table.from_pandas(df.reset_index(), preserve_index=False).to_pylist()
 
 
 def _to_date(val) -> date | None:
@@ -48,48 +54,72 @@ def _to_date(val) -> date | None:
         return None
 
 
-def _fetch_earnings_raw() -> dict[date, dict[str, list[dict]]]:
-    """Synchronous yfinance fetch — returns dict[day, dict[company, list[item]]]."""
+_EARNINGS_PAGE_SIZE = 100
+_EARNINGS_PAGES_PER_BATCH = 4
+
+
+def _fetch_earnings_page(start: datetime, offset: int) -> pd.DataFrame | None:
+    """Blocking fetch of one earnings-calendar page.
+
+    ``yf.Calendars`` caches the last response on the instance, so every page
+    gets its own instance to stay safe when pages are fetched concurrently.
+    """
+    cal = yf.Calendars(start=start)
+    return cal.get_earnings_calendar(
+        limit=_EARNINGS_PAGE_SIZE, offset=offset,
+        market_cap=1_000_000_000, filter_most_active=False,
+    )
+
+
+async def _fetch_earnings_raw() -> dict[date, dict[str, list[dict]]]:
+    """Fetch the earnings calendar — returns dict[day, dict[company, list[item]]].
+
+    Pages are requested a few at a time in worker threads; fetching stops at
+    the first empty or short page.
+    """
     yesterday = datetime.now() - timedelta(days=1)
-    cal = yf.Calendars(start=yesterday)
 
     result: dict[date, dict[str, list[dict]]] = {}
     offset = 0
     while True:
-        df = cal.get_earnings_calendar(
-            limit=100, offset=offset,
-            market_cap=1_000_000_000, filter_most_active=False,
+        offsets = range(
+            offset,
+            offset + _EARNINGS_PAGES_PER_BATCH * _EARNINGS_PAGE_SIZE,
+            _EARNINGS_PAGE_SIZE,
         )
-        if df is None or df.empty:
-            break
-        records = _df_to_records(df)
-        for r in records:
-            sym = r.get("Symbol") or r.get("index", "")
-            company = r.get("Company") or sym
-            item = {
-                "symbol": sym,
-                "marketcap": r.get("Marketcap"),
-                "event_name": r.get("Event Name"),
-                "date": r.get("Event Start Date"),
-                "timing": r.get("Timing"),
-                "eps_estimate": r.get("EPS Estimate"),
-                "reported_eps": r.get("Reported EPS"),
-                "surprise_pct": r.get("Surprise(%)"),
-            }
-            key = _to_date(item["date"])
-            if key is None:
-                continue
-            result.setdefault(key, {}).setdefault(company, []).append(item)
-        if len(records) < 100:
-            break
-        offset += 100
-    return result
+        frames = await asyncio.gather(
+            *(asyncio.to_thread(_fetch_earnings_page, yesterday, o) for o in offsets)
+        )
+        for df in frames:
+            if df is None or df.empty:
+                return result
+            records = _df_to_records(df)
+            for r in records:
+                sym = r.get("Symbol") or r.get("index", "")
+                company = r.get("Company") or sym
+                item = {
+                    "symbol": sym,
+                    "marketcap": r.get("Marketcap"),
+                    "event_name": r.get("Event Name"),
+                    "date": r.get("Event Start Date"),
+                    "timing": r.get("Timing"),
+                    "eps_estimate": r.get("EPS Estimate"),
+                    "reported_eps": r.get("Reported EPS"),
+                    "surprise_pct": r.get("Surprise(%)"),
+                }
+                key = _to_date(item["date"])
+                if key is None:
+                    continue
+                result.setdefault(key, {}).setdefault(company, []).append(item)
+            if len(records) < _EARNINGS_PAGE_SIZE:
+                return result
+        offset = offsets[-1] + _EARNINGS_PAGE_SIZE
 
 
 async def sync_earnings_calendar() -> None:
     log.info("Syncing market earnings calendar")
     try:
-        data = await asyncio.to_thread(_fetch_earnings_raw)
+        data = await _fetch_earnings_raw()
         if not data:
             log.warning("No earnings calendar data returned")
             return
@@ -115,21 +145,20 @@ def _parse_day(val) -> date | None:
         return None
 
 
-def _fetch_economics_raw() -> list[dict]:
-    """Synchronous HTTP fetch + parse."""
+async def _fetch_economics_raw() -> list[dict]:
+    """Async HTTP fetch; the CPU-bound parse runs in a worker thread."""
     url = "https://www.forexfactory.com/calendar"
-    response = curl.get(url, impersonate="chrome")
+    response = await _http_session().get(url)
     if response.status_code != 200:
         log.warning("Failed to fetch economics calendar: HTTP %d", response.status_code)
         return []
-    table = extract_calendar_table(response.text)
-    return parse_economic_calendar(table)
+    return await asyncio.to_thread(parse_calendar_page, response.text)
 
 
 async def sync_economics_calendar() -> None:
     try:
         log.info("Syncing economic events calendar")
-        events = await asyncio.to_thread(_fetch_economics_raw)
+        events = await _fetch_economics_raw()
         if not events:
             log.warning("No economic events found in calendar data")
             return
@@ -149,5 +178,5 @@ async def sync_economics_calendar() -> None:
 
 
 async def sync_all_calendars() -> None:
-    await sync_earnings_calendar()
-    await sync_economics_calendar()
+    # Independent sources and tables; both log and swallow their own errors.
+    await asyncio.gather(sync_earnings_calendar(), sync_economics_calendar())
@@ -3,16 +3,29 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
+from enum import Enum
 from fractions import Fraction
 from typing import cast
 
 import pandas as pd
 import yfinance as yf
+from yfinance.data import YfData  # private module; only used by _fetch_quotes
 
 from app.storage import read_watchlist, write_stock
+from app.storage.cache import TTLCache
 
 log = logging.getLogger(__name__)
 
+# Symbols Yahoo's quote lookup doesn't know, keyed upper-case. Only consulted for tickers
+# users ask for; the scheduled sync always re-fetches its watchlist.
+_unknown_symbols = TTLCache(3600, maxsize=1024)
+
+
+class SyncResult(Enum):
+    SYNCED = "synced"
+    UNKNOWN = "unknown"  # Yahoo's quote lookup has no such symbol
+    FAILED = "failed"  # lookup, fetch or write raised; worth retrying later
+
 
 def _nan_to_none(val):
     if val is None:
@@ -96,15 +109,96 @@ def fetch_single_stock(ticker: str) -> dict:
     }
 
 
-async def sync_single_stock(ticker: str) -> None:
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+# Symbols per quote request; keeps the query string well under URL limits.
+_QUOTE_BATCH = 200
+
+
+def _fetch_quotes(symbols: list[str]) -> dict:
+    """Blocking call to Yahoo's v7 quote endpoint for *symbols*.
+
+    yfinance exposes no public batch quote call, so this borrows its private
+    ``YfData`` client for the cookie/crumb handshake. Keep every use of that
+    module here: it can change on any yfinance upgrade.
+    """
+    
+    resp = YfData().get_raw_json(
+        _QUOTE_URL, params={"symbols": ",".join(symbols), "formatted": "false"},
+    )
+    quote = resp["quoteResponse"]
+    if quote.get("error"):
+        raise RuntimeError(f"Quote lookup failed: {quote['error']}")
+    return quote
+
+
+def _listed_symbols(symbols: list[str]) -> set[str]:
+    """Return the subset of *symbols* Yahoo's quote endpoint knows, upper-cased.
+
+    Raises on HTTP or lookup errors, so an outage can't be mistaken for an
+    unknown symbol.
+    """
+    quote = _fetch_quotes(symbols)
+    return {r["symbol"].upper() for r in quote.get("result") or ()}
+
+
+async def check_symbols(tickers: list[str]) -> tuple[list[str], list[str], list[str]]:
+    """Split requested *tickers* into (listed, unknown, unchecked).
+
+    Symbols Yahoo recently didn't know are answered from the negative cache;
+    the rest are looked up in batches. Tickers whose lookup errored come back
+    as unchecked.
+    """
+    listed: list[str] = []
+    unknown: list[str] = []
+    unchecked: list[str] = []
+    pending: list[str] = []
+    for ticker in tickers:
+        if _unknown_symbols.get(ticker.upper()):
+            log.info("Skipping %s: unknown to Yahoo on a recent attempt", ticker)
+            unknown.append(ticker)
+        else:
+            pending.append(ticker)
+
+    for i in range(0, len(pending), _QUOTE_BATCH):
+        batch = pending[i : i + _QUOTE_BATCH]
+        try:
+            found = await asyncio.to_thread(_listed_symbols, batch)
+        except Exception:
+            log.error("Symbol lookup failed for %d tickers", len(batch), exc_info=True)
+            unchecked.extend(batch)
+            continue
+        for ticker in batch:
+            if ticker.upper() in found:
+                listed.append(ticker)
+            else:
+                log.warning("Yahoo does not know symbol %s", ticker)
+                _unknown_symbols.set(ticker.upper(), True)
+                unknown.append(ticker)
+    return listed, unknown, unchecked
+
+
+async def sync_single_stock(ticker: str) -> SyncResult:
     """Fetch and persist data for a single ticker."""
     log.info("Syncing stock data for %s", ticker)
     try:
         data = await asyncio.to_thread(fetch_single_stock, ticker)
         await write_stock(ticker, data)
         log.info("Synced %s successfully", ticker)
+        return SyncResult.SYNCED
     except Exception:
         log.error("Failed to sync %s", ticker, exc_info=True)
+        return SyncResult.FAILED
+
+
+async def sync_requested_stock(ticker: str) -> SyncResult:
+    """Sync a ticker a user asked for, once Yahoo confirms the symbol exists."""
+    listed, unknown, _ = await check_symbols([ticker])
+    if unknown:
+        return SyncResult.UNKNOWN
+    if not listed:
+        return SyncResult.FAILED
+    return await sync_single_stock(ticker)
 
 
 async def sync_all_stocks() -> None:
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from lxml import html
+from lxml import etree, html
 from lxml.html import tostring
 
 _CET = ZoneInfo("Europe/Berlin")
 
 
+_EVENT_ROWS = etree.XPath(".//tr[@data-event-id]")
+_CALENDAR_CELLS = etree.XPath("descendant::*[contains(@class, 'calendar__')]")
+
 _IMPACT_MAP = {
     "red": "High",
     "ora": "Medium",
@@ -25,6 +29,19 @@ def _text(el: html.HtmlElement | None) -> str | None:
     return t or None
 
 
+def _row_cells(row: html.HtmlElement) -> dict[str, html.HtmlElement]:
+    """Map each ``calendar__*`` class in *row* to its first matching element.
+
+    One descendant walk per row replaces a separate ``find_class`` per column.
+    """
+    cells: dict[str, html.HtmlElement] = {}
+    for el in _CALENDAR_CELLS(row):
+        for cls in el.classes:
+            if cls.startswith("calendar__"):
+                cells.setdefault(cls, el)
+    return cells
+
+
 def _impact_label(td: html.HtmlElement) -> str | None:
     """Extract impact level from the icon class on the <span> inside *td*."""
     for span in td.iter("span"):
@@ -35,33 +52,36 @@ def _impact_label(td: html.HtmlElement) -> str | None:
     return None
 
 
-def extract_calendar_table(page_html: str) -> str:
-    """Extract the raw ``<table class="calendar__table">`` from a full page."""
-    doc = html.fromstring(page_html)
+def _calendar_table(doc: html.HtmlElement) -> html.HtmlElement:
     tables = doc.find_class("calendar__table")
     if not tables:
         raise ValueError("No <table class='calendar__table'> found in HTML")
-    return str(tostring(tables[0], encoding="unicode"))
+    return tables[0]
+
+
+def extract_calendar_table(page_html: str) -> str:
+    """Extract the raw ``<table class="calendar__table">`` from a full page."""
+    table = _calendar_table(html.fromstring(page_html))
+    return str(tostring(table, encoding="unicode"))
 
 
-def _resolve_date(raw: str) -> date:
+@lru_cache(maxsize=256)
+def _resolve_date(raw: str, today: date) -> date:
     """Parse a ForexFactory date like 'Thu Feb 26' into a date with correct year.
 
-    ForexFactory doesn't include the year, so we infer it: if the resulting date
-    is more than 3 months in the future, it's probably last year; if more than
-    9 months in the past, it's probably next year.
+    ForexFactory doesn't include the year, so we infer it relative to *today*:
+    if the resulting date is more than 3 months in the future, it's probably
+    last year; if more than 9 months in the past, it's probably next year.
     """
-    parsed = datetime.strptime(raw, "%a %b %d").date()
-    today = date.today()
-    candidate = parsed.replace(year=today.year)
+    parsed = datetime.strptime(raw, "%a %b %d")
+    candidate = date(today.year, parsed.month, parsed.day)
     delta = (candidate - today).days
-    if delta > 90:
-        candidate = candidate.replace(year=today.year - 1)
-    elif delta < -270:
-        candidate = candidate.replace(year=today.year + 1)
-    return candidate
+    # +1 → last year, -1 → next year, 0 → this year
+    shift = (delta > 90) - (delta < -270)
+    return candidate if not shift else candidate.replace(year=today.year - shift)
 
 
+@lru_cache(maxsize=256)
 def _parse_time(raw: str | None) -> time | None:
     """Parse a ForexFactory time like '8:30am' into a time object.
 
@@ -70,6 +90,17 @@ def _parse_time(raw: str | None) -> time | None:
     if not raw:
         return None
     raw = raw.strip().lower()
+    # Fast path for the usual 'h:mmam' / 'hh:mm pm' shape.
+    hours, sep, rest = raw.partition(":")
+    minutes, suffix = rest[:2], rest[2:].lstrip()
+    if (
+        sep and suffix in ("am", "pm") and len(hours) <= 2 and len(minutes) == 2
+        # ASCII digits only: isdigit() also accepts e.g. '²', which int() rejects.
+        and hours.isascii() and hours.isdecimal() and minutes.isascii() and minutes.isdecimal()
+    ):
+        h, m = int(hours), int(minutes)
+        if 1 <= h <= 12 and m < 60:
+            return time(h % 12 + (12 if suffix == "pm" else 0), m)
     for fmt in ("%I:%M%p", "%I:%M %p"):
         try:
             return datetime.strptime(raw, fmt).time()
@@ -84,45 +115,56 @@ def parse_economic_calendar(raw_html: str) -> list[dict]:
     Each returned dict contains:
         date, is_all_day, currency, impact, event, actual, forecast, previous
     """
-    doc = html.fromstring(raw_html)
-    rows = doc.xpath('//tr[@data-event-id]')
+    return _parse_rows(html.fromstring(raw_html))
+
+
+def parse_calendar_page(page_html: str) -> list[dict]:
+    """Parse the calendar straight from a full ForexFactory page.
+
+    Equivalent to ``parse_economic_calendar(extract_calendar_table(page_html))``
+    but builds the element tree only once.
+    """
+    return _parse_rows(_calendar_table(html.fromstring(page_html)))
+
+
+def _parse_rows(root: html.HtmlElement) -> list[dict]:
+    rows = _EVENT_ROWS(root)
+    today = date.today()
 
     events: list[dict] = []
     current_date: date | None = None
     current_time_str: str | None = None
 
     for row in rows:
+        cells = _row_cells(row)
+
         # --- date (only present on first row of each day) ---
-        date_td = row.find_class("calendar__date")
-        if date_td:
-            raw = _text(date_td[0])
+        date_td = cells.get("calendar__date")
+        if date_td is not None:
+            raw = _text(date_td)
             if raw:
-                current_date = _resolve_date(raw)
+                current_date = _resolve_date(raw, today)
                 current_time_str = None  # reset time on new day
 
         # --- time (empty means same as previous row) ---
-        time_td = row.find_class("calendar__time")
-        if time_td:
-            t = _text(time_td[0])
-            if t:
-                current_time_str = t
+        t = _text(cells.get("calendar__time"))
+        if t:
+            current_time_str = t
 
         # --- currency ---
-        cur_td = row.find_class("calendar__currency")
-        currency = _text(cur_td[0]) if cur_td else None
+        currency = _text(cells.get("calendar__currency"))
 
         # --- impact ---
-        imp_td = row.find_class("calendar__impact")
-        impact = _impact_label(imp_td[0]) if imp_td else None
+        imp_td = cells.get("calendar__impact")
+        impact = _impact_label(imp_td) if imp_td is not None else None
 
         # --- event title ---
-        title_spans = row.find_class("calendar__event-title")
-        event_name = _text(title_spans[0]) if title_spans else None
+        event_name = _text(cells.get("calendar__event-title"))
 
         # --- actual / forecast / previous ---
-        actual = _text(row.find_class("calendar__actual")[0]) if row.find_class("calendar__actual") else None
-        forecast = _text(row.find_class("calendar__forecast")[0]) if row.find_class("calendar__forecast") else None
-        previous = _text(row.find_class("calendar__previous")[0]) if row.find_class("calendar__previous") else None
+        actual = _text(cells.get("calendar__actual"))
+        forecast = _text(cells.get("calendar__forecast"))
+        previous = _text(cells.get("calendar__previous"))
 
         # --- build full datetime ---
         is_all_day = False
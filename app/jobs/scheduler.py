@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING
 
 from apscheduler import AsyncScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app.database import close_db, init_db
-from app.jobs.fetch_calendars import sync_all_calendars
+from app.jobs.fetch_calendars import close_http_session, sync_all_calendars
 from app.jobs.fetch_stock import sync_all_stocks
 
 if TYPE_CHECKING:
@@ -19,6 +19,40 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# The manual full sync currently running, if any; concurrent triggers join it.
+_sync_task: asyncio.Task | None = None
+
+
+async def _run_full_sync() -> None:
+    # Independent jobs against different upstreams — run them side by side.
+    results = await asyncio.gather(
+        sync_all_stocks(), sync_all_calendars(), return_exceptions=True,
+    )
+    for r in results:
+        if isinstance(r, BaseException):
+            log.error("Manual sync failed", exc_info=r)
+
+
+def start_manual_sync() -> bool:
+    """Start a full sync in the background; False if one is already running."""
+    global _sync_task
+    # No await between the check and the assignment, so no lock is needed.
+    if _sync_task is not None and not _sync_task.done():
+        return False
+    _sync_task = asyncio.create_task(_run_full_sync())
+    return True
+
+
+async def cancel_manual_sync() -> None:
+    """Cancel the running manual sync, if any, and wait for it to unwind."""
+    global _sync_task
+    task, _sync_task = _sync_task, None
+    if task is None or task.done():
+        return
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[dict]:
@@ -41,4 +75,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[dict]:
         yield {"scheduler": scheduler}
         task.cancel()
 
+    # Stop a manual sync before its HTTP session and pool go away.
+    await cancel_manual_sync()
+    await close_http_session()
     await close_db()
@@ -1,17 +1,53 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from typing import Annotated
+
 from fastapi import APIRouter
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+from app.jobs.fetch_stock import SyncResult, check_symbols, sync_single_stock
+from app.jobs.scheduler import start_manual_sync
+from app.storage import add_to_watchlist_many, cache_stats, read_watchlist, remove_from_watchlist
 
-from app.jobs.fetch_calendars import sync_all_calendars
-from app.jobs.fetch_stock import sync_all_stocks, sync_single_stock
-from app.storage import add_to_watchlist, read_watchlist, remove_from_watchlist
+log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin")
 
+# Upper bound on concurrent upstream fetches triggered by a single request.
+_SYNC_CONCURRENCY = 8
+
+
+# Yahoo symbols: letters/digits plus '.', '-', '^' (indices) and '=' (FX/futures).
+# pydantic strips whitespace before the pattern check but upper-cases after
+# it, so the pattern has to accept lower case.
+Ticker = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, to_upper=True, pattern=r"^[A-Za-z0-9.^=-]{1,15}$"),
+]
+
 
 class AddTickersRequest(BaseModel):
-    tickers: list[str]
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
+
+    tickers: Annotated[list[Ticker], Field(max_length=1000)]
+
+    @field_validator("tickers")
+    @classmethod
+    def _dedupe_tickers(cls, tickers: list[str]) -> list[str]:
+        # Symbols arrive stripped and upper-cased; drop repeats, keeping order.
+        return list(dict.fromkeys(tickers))
+
+
+class AddTickersResponse(BaseModel):
+    watchlist: list[str]
+    # Requested tickers now on the watchlist.
+    added: list[str]
+    # Requested tickers Yahoo doesn't know; not watchlisted.
+    rejected: list[str]
+    # Added, but the initial fetch errored; the hourly sync will retry them.
+    failed: list[str]
 
 
 @router.get("/watchlist")
@@ -20,21 +56,44 @@ async def get_watchlist() -> list[str]:
 
 
 @router.post("/watchlist")
-async def add_tickers(req: AddTickersRequest) -> list[str]:
-    for ticker in req.tickers:
-        await add_to_watchlist(ticker)
-        await sync_single_stock(ticker.upper())
-    return await read_watchlist()
+async def add_tickers(req: AddTickersRequest) -> AddTickersResponse:
+    """Watchlist every ticker Yahoo doesn't report as unknown, syncing the listed ones."""
+    listed, _, unchecked = await check_symbols(req.tickers)
+    sem = asyncio.Semaphore(_SYNC_CONCURRENCY)
+
+    async def _sync(ticker: str) -> SyncResult:
+        async with sem:
+            return await sync_single_stock(ticker)
+
+    # Unchecked tickers are watchlisted unsynced; the hourly sync picks them up.
+    results = await asyncio.gather(*(_sync(t) for t in listed))
+    failed = {t for t, r in zip(listed, results) if r is SyncResult.FAILED}
+    failed.update(unchecked)
+    keep = set(listed).union(unchecked)
+    watchlist = await add_to_watchlist_many([t for t in req.tickers if t in keep])
+
+    # An unknown ticker that was already watchlisted counts as added, not rejected.
+    on_watchlist = set(watchlist)
+    return AddTickersResponse(
+        watchlist=watchlist,
+        added=[t for t in req.tickers if t in on_watchlist],
+        rejected=[t for t in req.tickers if t not in on_watchlist],
+        failed=[t for t in req.tickers if t in failed],
+    )
 
 
 @router.delete("/watchlist/{ticker}")
 async def remove_ticker(ticker: str) -> list[str]:
-    await remove_from_watchlist(ticker)
-    return await read_watchlist()
+    return await remove_from_watchlist(ticker)
 
 
-@router.post("/sync")
+@router.post("/sync", status_code=202)
 async def trigger_sync() -> dict:
-    await sync_all_stocks()
-    await sync_all_calendars()
-    return {"status": "ok"}
+    if not start_manual_sync():
+        return {"status": "running", "coalesced": True}
+    return {"status": "queued"}
+
+
+@router.get("/cache")
+async def get_cache_stats() -> dict:
+    return cache_stats()
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
+from pydantic import TypeAdapter
 
 from app.models import EarningsCalendarItem, EconomicsCalendarItem
 from app.storage import read_earnings_calendar, read_economics_calendar
@@ -11,29 +12,43 @@ router = APIRouter(prefix="/calendar")
 
 _DAY_FMT = "%A, %m/%d/%Y"
 
+_EarningsCalendar = dict[str, dict[str, list[EarningsCalendarItem]]]
+_EconomicsCalendar = dict[str, list[EconomicsCalendarItem]]
 
-@router.get("/earnings", response_model=dict[str, dict[str, list[EarningsCalendarItem]]])
+_EARNINGS_CALENDAR = TypeAdapter(_EarningsCalendar)
+_ECONOMICS_CALENDAR = TypeAdapter(_EconomicsCalendar)
+
+
+def _json_response(adapter: TypeAdapter, payload: dict) -> Response:
+    """Validate *payload* and serialize it in one pass.
+
+    Returning a ``Response`` makes FastAPI skip its own response-model
+    validation and encoding; the ``response_model`` on the route is kept for
+    the OpenAPI schema only.
+    """
+    body = adapter.dump_json(adapter.validate_python(payload))
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/earnings", response_model=_EarningsCalendar)
 async def get_earnings_calendar(
     start: date | None = Query(None, description="Start date YYYY-MM-DD"),
     end: date | None = Query(None, description="End date YYYY-MM-DD"),
 ):
     data = await read_earnings_calendar(start=start, end=end)
-    return {
-        day.strftime(_DAY_FMT): {
-            company: [EarningsCalendarItem(**i) for i in items]
-            for company, items in companies.items()
-        }
-        for day, companies in data.items()
-    }
+    return _json_response(
+        _EARNINGS_CALENDAR,
+        {day.strftime(_DAY_FMT): companies for day, companies in data.items()},
+    )
 
 
-@router.get("/economics", response_model=dict[str, list[EconomicsCalendarItem]])
+@router.get("/economics", response_model=_EconomicsCalendar)
 async def get_economics_calendar(
     start: date | None = Query(None, description="Start date YYYY-MM-DD"),
     end: date | None = Query(None, description="End date YYYY-MM-DD"),
 ):
     data = await read_economics_calendar(start=start, end=end)
-    return {
-        day.strftime(_DAY_FMT): [EconomicsCalendarItem(**e) for e in events]
-        for day, events in data.items()
-    }
+    return _json_response(
+        _ECONOMICS_CALENDAR,
+        {day.strftime(_DAY_FMT): events for day, events in data.items()},
+    )
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Query
+from pydantic import TypeAdapter
 
-from app.jobs.fetch_stock import sync_single_stock
+from app.jobs.fetch_stock import SyncResult, sync_requested_stock
 from app.models import DividendRecord, EarningsDate, SplitRecord, StockCalendar
 from app.storage import add_to_watchlist, read_stock
 
 router = APIRouter(prefix="/stocks")
 
+_EARNINGS = TypeAdapter(list[EarningsDate])
+_DIVIDENDS = TypeAdapter(list[DividendRecord])
+_SPLITS = TypeAdapter(list[SplitRecord])
+
 
 async def _load_stock(ticker: str) -> dict:
     """Load stock data from DB, auto-fetching if not yet cached."""
     data = await read_stock(ticker)
     if data is None:
+        result = await sync_requested_stock(ticker)
+        # Unknown symbols stay off the watchlist; failed fetches are left for
+        # the hourly sync to retry.
+        if result is SyncResult.UNKNOWN:
+            raise HTTPException(status_code=404, detail=f"Unknown symbol {ticker}")
         await add_to_watchlist(ticker)
-        await sync_single_stock(ticker)
-        data = await read_stock(ticker)
+        if result is SyncResult.SYNCED:
+            data = await read_stock(ticker)
     if not isinstance(data, dict):
         raise HTTPException(status_code=502, detail=f"Failed to fetch data for {ticker}")
     return data
@@ -27,7 +37,7 @@ async def get_stock_calendar(ticker: str):
     cal = data.get("calendar")
     if not cal:
         raise HTTPException(status_code=404, detail=f"No calendar data for {ticker}")
-    return StockCalendar(**cal)
+    return StockCalendar.model_validate(cal)
 
 
 @router.get("/{ticker}/earnings", response_model=list[EarningsDate])
@@ -38,16 +48,16 @@ async def get_stock_earnings(
 ):
     data = await _load_stock(ticker)
     earnings = data.get("earnings", [])
-    return [EarningsDate(**e) for e in earnings[offset : offset + limit]]
+    return _EARNINGS.validate_python(earnings[offset : offset + limit])
 
 
 @router.get("/{ticker}/dividends", response_model=list[DividendRecord])
 async def get_stock_dividends(ticker: str):
     data = await _load_stock(ticker)
-    return [DividendRecord(**d) for d in data.get("dividends", [])]
+    return _DIVIDENDS.validate_python(data.get("dividends", []))
 
 
 @router.get("/{ticker}/splits", response_model=list[SplitRecord])
 async def get_stock_splits(ticker: str):
     data = await _load_stock(ticker)
-    return [SplitRecord(**s) for s in data.get("splits", [])]
+    return _SPLITS.validate_python(data.get("splits", []))
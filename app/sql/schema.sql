@@ -68,3 +68,17 @@ CREATE TABLE IF NOT EXISTS economics_calendar (
     previous    TEXT,
     UNIQUE (date, event)
 );
+
+-- Tell every worker's LISTEN connection to drop its cached watchlist.
+-- Identical notifications within one transaction are collapsed by Postgres.
+CREATE OR REPLACE FUNCTION notify_watchlist_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('watchlist_changed', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS watchlist_changed ON watchlist;
+CREATE TRIGGER watchlist_changed
+    AFTER INSERT OR DELETE ON watchlist
+    FOR EACH ROW EXECUTE FUNCTION notify_watchlist_changed();
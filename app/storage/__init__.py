@@ -1,5 +1,7 @@
 from app.storage.queries import (
     add_to_watchlist,
+    add_to_watchlist_many,
+    cache_stats,
     read_earnings_calendar,
     read_economics_calendar,
     read_stock,
@@ -12,6 +14,8 @@ from app.storage.queries import (
 
 __all__ = [
     "add_to_watchlist",
+    "add_to_watchlist_many",
+    "cache_stats",
     "read_earnings_calendar",
     "read_economics_calendar",
     "read_stock",
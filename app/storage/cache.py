@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Small in-process cache whose entries expire *ttl* seconds after being set.
+
+    Every operation is synchronous, so on a single event loop no locking is
+    needed. Once *maxsize* entries are stored, the oldest one is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                self.hits += 1
+                return value
+            del self._data[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl": self.ttl,
+        }
@@ -1,127 +1,231 @@
 from __future__ import annotations
 
-import json
 from datetime import date, datetime
 
 import app.database as db
+from app.config import READ_CACHE_TTL
+from app.storage.cache import TTLCache
+
+# Reads are served from memory until the TTL lapses or a writer invalidates.
+_watchlist_cache = TTLCache(READ_CACHE_TTL)
+_stock_cache = TTLCache(READ_CACHE_TTL)
+_earnings_cache = TTLCache(READ_CACHE_TTL)
+_economics_cache = TTLCache(READ_CACHE_TTL)
+
+# Bumped on every watchlist change. A read or mutation only stores its result
+# if no other change landed while its query was in flight.
+_watchlist_version = 0
+
+
+def _invalidate_watchlist() -> None:
+    global _watchlist_version
+    _watchlist_version += 1
+    _watchlist_cache.clear()
+
+
+def _prime_watchlist(version: int, tickers: list[str]) -> None:
+    """Cache the watchlist a mutation returned, unless another change raced it."""
+    raced = version != _watchlist_version
+    _invalidate_watchlist()
+    if not raced:
+        _watchlist_cache.set("watchlist", tickers)
+
+
+# Other workers mutate the watchlist too; a table trigger NOTIFYs on change.
+db.on_notify("watchlist_changed", _invalidate_watchlist)
+
+
+def cache_stats() -> dict[str, dict]:
+    return {
+        "watchlist": _watchlist_cache.stats(),
+        "stocks": _stock_cache.stats(),
+        "earnings_calendar": _earnings_cache.stats(),
+        "economics_calendar": _economics_cache.stats(),
+    }
+
+
+# asyncpg prepares each distinct query string once per connection and reuses
+# it from the statement cache, so keep the hot statements as fixed constants.
+_READ_WATCHLIST_SQL = "SELECT ticker FROM watchlist ORDER BY ticker"
+
+_INSERT_WATCHLIST_SQL = "INSERT INTO watchlist (ticker) VALUES ($1) ON CONFLICT DO NOTHING"
 
 
 async def read_watchlist() -> list[str]:
+    cached = _watchlist_cache.get("watchlist")
+    if cached is not None:
+        return cached
+    version = _watchlist_version
     async with db.get_pool().acquire() as conn:
-        rows = await conn.fetch("SELECT ticker FROM watchlist ORDER BY ticker")
-    return [r["ticker"] for r in rows]
+        rows = await conn.fetch(_READ_WATCHLIST_SQL)
+    tickers = [r["ticker"] for r in rows]
+    if version == _watchlist_version:
+        _watchlist_cache.set("watchlist", tickers)
+    return tickers
 
 
 async def add_to_watchlist(ticker: str) -> None:
     upper = ticker.upper()
     async with db.get_pool().acquire() as conn:
-        await conn.execute(
-            "INSERT INTO watchlist (ticker) VALUES ($1) ON CONFLICT DO NOTHING",
-            upper,
-        )
+        await conn.execute(_INSERT_WATCHLIST_SQL, upper)
+    _invalidate_watchlist()
+
+
+# Data-modifying CTEs: the outer SELECT still sees the pre-statement snapshot,
+# so inserted rows are unioned in and deleted rows filtered out explicitly.
+_ADD_TO_WATCHLIST_SQL = """
+WITH ins AS (
+    INSERT INTO watchlist (ticker) SELECT unnest($1::text[])
+    ON CONFLICT DO NOTHING
+    RETURNING ticker
+)
+SELECT ticker FROM watchlist
+UNION ALL
+SELECT ticker FROM ins
+ORDER BY ticker
+"""
+
+_REMOVE_FROM_WATCHLIST_SQL = """
+WITH del AS (
+    DELETE FROM watchlist WHERE ticker = $1
+    RETURNING ticker
+)
+SELECT ticker FROM watchlist
+WHERE ticker NOT IN (SELECT ticker FROM del)
+ORDER BY ticker
+"""
+
+
+async def add_to_watchlist_many(tickers: list[str]) -> list[str]:
+    """Add *tickers* and return the updated watchlist in the same round trip.
+
+    One statement, so one implicit transaction and one commit however many
+    tickers are passed; the returned list is read from that same snapshot.
+    """
+    upper = [t.upper() for t in tickers]
+    version = _watchlist_version
+    async with db.get_pool().acquire() as conn:
+        rows = await conn.fetch(_ADD_TO_WATCHLIST_SQL, upper)
+    result = [r["ticker"] for r in rows]
+    _prime_watchlist(version, result)
+    return result
 
 
-async def remove_from_watchlist(ticker: str) -> None:
+async def remove_from_watchlist(ticker: str) -> list[str]:
+    """Remove *ticker* and return the updated watchlist in the same round trip."""
     upper = ticker.upper()
+    version = _watchlist_version
     async with db.get_pool().acquire() as conn:
-        await conn.execute("DELETE FROM watchlist WHERE ticker = $1", upper)
+        rows = await conn.fetch(_REMOVE_FROM_WATCHLIST_SQL, upper)
+    result = [r["ticker"] for r in rows]
+    _prime_watchlist(version, result)
+    return result
+
+
+_READ_STOCK_SQL = """
+SELECT
+    (SELECT json_build_object(
+                'dividend_date', dividend_date,
+                'ex_dividend_date', ex_dividend_date,
+                'earnings_dates', earnings_dates,
+                'earnings_high', earnings_high,
+                'earnings_low', earnings_low,
+                'earnings_average', earnings_average,
+                'revenue_high', revenue_high,
+                'revenue_low', revenue_low,
+                'revenue_average', revenue_average)
+       FROM stock_calendar WHERE ticker = $1) AS calendar,
+    (SELECT json_agg(json_build_object(
+                'date', date,
+                'eps_estimate', eps_estimate,
+                'reported_eps', reported_eps,
+                'surprise_pct', surprise_pct) ORDER BY date DESC)
+       FROM stock_earnings WHERE ticker = $1) AS earnings,
+    (SELECT json_agg(json_build_object('date', date, 'amount', amount) ORDER BY date DESC)
+       FROM stock_dividends WHERE ticker = $1) AS dividends,
+    (SELECT json_agg(json_build_object('date', date, 'ratio', ratio) ORDER BY date DESC)
+       FROM stock_splits WHERE ticker = $1) AS splits
+"""
 
 
 async def read_stock(ticker: str) -> dict | None:
     upper = ticker.upper()
+    cached = _stock_cache.get(upper)
+    if cached is not None:
+        return cached
+
+    # One round trip: each slice comes back pre-shaped as JSON and is decoded
+    # by the connection's json codec.
     async with db.get_pool().acquire() as conn:
-        cal = await conn.fetchrow(
-            "SELECT * FROM stock_calendar WHERE ticker = $1", upper
-        )
-        earnings = await conn.fetch(
-            "SELECT date, eps_estimate, reported_eps, surprise_pct "
-            "FROM stock_earnings WHERE ticker = $1 ORDER BY date DESC",
-            upper,
-        )
-        dividends = await conn.fetch(
-            "SELECT date, amount FROM stock_dividends WHERE ticker = $1 ORDER BY date DESC",
-            upper,
-        )
-        splits = await conn.fetch(
-            "SELECT date, ratio FROM stock_splits WHERE ticker = $1 ORDER BY date DESC",
-            upper,
-        )
+        row = await conn.fetchrow(_READ_STOCK_SQL, upper)
 
-    if not cal and not earnings and not dividends and not splits:
+    if not any(row.values()):
         return None
 
-    calendar_data = None
-    if cal:
-        earnings_dates = cal["earnings_dates"]
-        if isinstance(earnings_dates, str):
-            earnings_dates = json.loads(earnings_dates)
-        calendar_data = {
-            "dividend_date": _date_str(cal["dividend_date"]),
-            "ex_dividend_date": _date_str(cal["ex_dividend_date"]),
-            "earnings_dates": earnings_dates,
-            "earnings_high": cal["earnings_high"],
-            "earnings_low": cal["earnings_low"],
-            "earnings_average": cal["earnings_average"],
-            "revenue_high": cal["revenue_high"],
-            "revenue_low": cal["revenue_low"],
-            "revenue_average": cal["revenue_average"],
-        }
-
-    return {
-        "calendar": calendar_data,
-        "earnings": [
-            {
-                "date": r["date"].isoformat() if r["date"] else None,
-                "eps_estimate": r["eps_estimate"],
-                "reported_eps": r["reported_eps"],
-                "surprise_pct": r["surprise_pct"],
-            }
-            for r in earnings
-        ],
-        "dividends": [
-            {"date": _date_str(r["date"]), "amount": r["amount"]}
-            for r in dividends
-        ],
-        "splits": [
-            {"date": _date_str(r["date"]), "ratio": r["ratio"]}
-            for r in splits
-        ],
+    result = {
+        "calendar": row["calendar"],
+        "earnings": row["earnings"] or [],
+        "dividends": row["dividends"] or [],
+        "splits": row["splits"] or [],
     }
+    _stock_cache.set(upper, result)
+    return result
+
+
+_UPSERT_STOCK_CALENDAR_SQL = """
+INSERT INTO stock_calendar
+    (ticker, dividend_date, ex_dividend_date, earnings_dates,
+     earnings_high, earnings_low, earnings_average,
+     revenue_high, revenue_low, revenue_average, updated_at)
+VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10, now())
+ON CONFLICT (ticker) DO UPDATE SET
+    dividend_date = EXCLUDED.dividend_date,
+    ex_dividend_date = EXCLUDED.ex_dividend_date,
+    earnings_dates = EXCLUDED.earnings_dates,
+    earnings_high = EXCLUDED.earnings_high,
+    earnings_low = EXCLUDED.earnings_low,
+    earnings_average = EXCLUDED.earnings_average,
+    revenue_high = EXCLUDED.revenue_high,
+    revenue_low = EXCLUDED.revenue_low,
+    revenue_average = EXCLUDED.revenue_average,
+    updated_at = now()
+"""
+
+_UPSERT_STOCK_EARNINGS_SQL = """
+INSERT INTO stock_earnings (ticker, date, eps_estimate, reported_eps, surprise_pct)
+VALUES ($1,$2,$3,$4,$5)
+ON CONFLICT (ticker, date) DO UPDATE SET
+    eps_estimate = COALESCE(EXCLUDED.eps_estimate, stock_earnings.eps_estimate),
+    reported_eps = COALESCE(EXCLUDED.reported_eps, stock_earnings.reported_eps),
+    surprise_pct = COALESCE(EXCLUDED.surprise_pct, stock_earnings.surprise_pct)
+"""
+
+_UPSERT_STOCK_DIVIDENDS_SQL = """
+INSERT INTO stock_dividends (ticker, date, amount)
+VALUES ($1,$2,$3)
+ON CONFLICT (ticker, date) DO UPDATE SET amount = EXCLUDED.amount
+"""
+
+_UPSERT_STOCK_SPLITS_SQL = """
+INSERT INTO stock_splits (ticker, date, ratio)
+VALUES ($1,$2,$3)
+ON CONFLICT (ticker, date) DO UPDATE SET ratio = EXCLUDED.ratio
+"""
 
 
 async def write_stock(ticker: str, data: dict) -> None:
     upper = ticker.upper()
     cal = data.get("calendar") or {}
-    earnings_dates = cal.get("earnings_dates")
-    if earnings_dates is not None:
-        earnings_dates = json.dumps(earnings_dates, default=str)
 
     async with db.get_pool().acquire() as conn:
         async with conn.transaction():
             # Upsert calendar
             await conn.execute(
-                """
-                INSERT INTO stock_calendar
-                    (ticker, dividend_date, ex_dividend_date, earnings_dates,
-                     earnings_high, earnings_low, earnings_average,
-                     revenue_high, revenue_low, revenue_average, updated_at)
-                VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10, now())
-                ON CONFLICT (ticker) DO UPDATE SET
-                    dividend_date = EXCLUDED.dividend_date,
-                    ex_dividend_date = EXCLUDED.ex_dividend_date,
-                    earnings_dates = EXCLUDED.earnings_dates,
-                    earnings_high = EXCLUDED.earnings_high,
-                    earnings_low = EXCLUDED.earnings_low,
-                    earnings_average = EXCLUDED.earnings_average,
-                    revenue_high = EXCLUDED.revenue_high,
-                    revenue_low = EXCLUDED.revenue_low,
-                    revenue_average = EXCLUDED.revenue_average,
-                    updated_at = now()
-                """,
+                _UPSERT_STOCK_CALENDAR_SQL,
                 upper,
                 _to_date(cal.get("dividend_date")),
                 _to_date(cal.get("ex_dividend_date")),
-                earnings_dates,
+                cal.get("earnings_dates"),
                 _to_float(cal.get("earnings_high")),
                 _to_float(cal.get("earnings_low")),
                 _to_float(cal.get("earnings_average")),
@@ -131,203 +235,205 @@ async def write_stock(ticker: str, data: dict) -> None:
             )
 
             # Upsert earnings
-            for e in data.get("earnings", []):
-                dt = _to_datetime(e.get("date"))
-                if dt is None:
-                    continue
-                await conn.execute(
-                    """
-                    INSERT INTO stock_earnings (ticker, date, eps_estimate, reported_eps, surprise_pct)
-                    VALUES ($1,$2,$3,$4,$5)
-                    ON CONFLICT (ticker, date) DO UPDATE SET
-                        eps_estimate = COALESCE(EXCLUDED.eps_estimate, stock_earnings.eps_estimate),
-                        reported_eps = COALESCE(EXCLUDED.reported_eps, stock_earnings.reported_eps),
-                        surprise_pct = COALESCE(EXCLUDED.surprise_pct, stock_earnings.surprise_pct)
-                    """,
+            earnings_rows = [
+                (
                     upper, dt,
                     _to_float(e.get("eps_estimate")),
                     _to_float(e.get("reported_eps")),
                     _to_float(e.get("surprise_pct")),
                 )
+                for e in data.get("earnings", [])
+                if (dt := _to_datetime(e.get("date"))) is not None
+            ]
+            # Insert in (ticker, date) index order — yfinance lists newest first.
+            earnings_rows.sort(key=lambda r: _ts_key(r[1]))
+            if earnings_rows:
+                await conn.executemany(_UPSERT_STOCK_EARNINGS_SQL, earnings_rows)
 
             # Upsert dividends
-            for d in data.get("dividends", []):
-                dt = _to_date(d.get("date"))
-                if dt is None:
-                    continue
-                await conn.execute(
-                    """
-                    INSERT INTO stock_dividends (ticker, date, amount)
-                    VALUES ($1,$2,$3)
-                    ON CONFLICT (ticker, date) DO UPDATE SET amount = EXCLUDED.amount
-                    """,
-                    upper, dt, _to_float(d.get("amount")),
-                )
+            dividend_rows = [
+                (upper, dt, _to_float(d.get("amount")))
+                for d in data.get("dividends", [])
+                if (dt := _to_date(d.get("date"))) is not None
+            ]
+            if dividend_rows:
+                await conn.executemany(_UPSERT_STOCK_DIVIDENDS_SQL, dividend_rows)
 
             # Upsert splits
-            for s in data.get("splits", []):
-                dt = _to_date(s.get("date"))
-                if dt is None:
-                    continue
-                await conn.execute(
-                    """
-                    INSERT INTO stock_splits (ticker, date, ratio)
-                    VALUES ($1,$2,$3)
-                    ON CONFLICT (ticker, date) DO UPDATE SET ratio = EXCLUDED.ratio
-                    """,
-                    upper, dt, s.get("ratio"),
-                )
+            split_rows = [
+                (upper, dt, s.get("ratio"))
+                for s in data.get("splits", [])
+                if (dt := _to_date(s.get("date"))) is not None
+            ]
+            if split_rows:
+                await conn.executemany(_UPSERT_STOCK_SPLITS_SQL, split_rows)
+
+    _stock_cache.pop(upper)
 
 
 async def read_earnings_calendar(
     start: date | None = None, end: date | None = None,
 ) -> dict[date, dict[str, list[dict]]]:
-    clauses = ["1=1"]
-    args: list = []
-    if start:
-        args.append(start)
-        clauses.append(f"date::date >= ${len(args)}")
-    if end:
-        args.append(end)
-        clauses.append(f"date::date <= ${len(args)}")
-    sql = (
-        "SELECT * FROM earnings_calendar WHERE "
-        + " AND ".join(clauses)
-        + " ORDER BY date::date DESC, id"
-    )
+    cached = _earnings_cache.get((start, end))
+    if cached is not None:
+        return cached
+
+    # Grouping by day and company happens in Postgres; each row is one day
+    # whose companies arrive as a JSON object in first-seen (id) order.
+    where, args = _date_range_filter(start, end)
+    sql = f"""
+        SELECT day, json_object_agg(company, items ORDER BY first_id) AS companies
+        FROM (
+            SELECT date::date AS day,
+                   COALESCE(NULLIF(company, ''), symbol) AS company,
+                   min(id) AS first_id,
+                   json_agg(json_build_object(
+                       'symbol', symbol,
+                       'marketcap', marketcap,
+                       'event_name', event_name,
+                       'date', date,
+                       'timing', timing,
+                       'eps_estimate', eps_estimate,
+                       'reported_eps', reported_eps,
+                       'surprise_pct', surprise_pct) ORDER BY id) AS items
+            FROM earnings_calendar
+            WHERE {where}
+            GROUP BY 1, 2
+        ) AS by_company
+        GROUP BY day
+        ORDER BY day DESC
+    """
     async with db.get_pool().acquire() as conn:
         rows = await conn.fetch(sql, *args)
-    result: dict[date, dict[str, list[dict]]] = {}
-    for r in rows:
-        day = r["date"].date() if r["date"] else None
-        if day is None:
-            continue
-        company = r["company"] or r["symbol"]
-        item = {
-            "symbol": r["symbol"],
-            "marketcap": r["marketcap"],
-            "event_name": r["event_name"],
-            "date": r["date"].isoformat() if r["date"] else None,
-            "timing": r["timing"],
-            "eps_estimate": r["eps_estimate"],
-            "reported_eps": r["reported_eps"],
-            "surprise_pct": r["surprise_pct"],
-        }
-        result.setdefault(day, {}).setdefault(company, []).append(item)
+    result = {r["day"]: r["companies"] for r in rows}
+    _earnings_cache.set((start, end), result)
     return result
 
 
+_UPSERT_EARNINGS_CALENDAR_SQL = """
+INSERT INTO earnings_calendar
+    (company, symbol, marketcap, event_name, date, timing,
+     eps_estimate, reported_eps, surprise_pct)
+VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9)
+ON CONFLICT (symbol, date) DO UPDATE SET
+    company = EXCLUDED.company,
+    marketcap = COALESCE(EXCLUDED.marketcap, earnings_calendar.marketcap),
+    event_name = COALESCE(EXCLUDED.event_name, earnings_calendar.event_name),
+    timing = COALESCE(EXCLUDED.timing, earnings_calendar.timing),
+    eps_estimate = COALESCE(EXCLUDED.eps_estimate, earnings_calendar.eps_estimate),
+    reported_eps = COALESCE(EXCLUDED.reported_eps, earnings_calendar.reported_eps),
+    surprise_pct = COALESCE(EXCLUDED.surprise_pct, earnings_calendar.surprise_pct)
+"""
+
+
 async def write_earnings_calendar(data: dict[date, dict[str, list[dict]]]) -> None:
+    rows = [
+        (
+            company, item.get("symbol", ""),
+            _to_float(item.get("marketcap")),
+            item.get("event_name"),
+            _to_datetime(item.get("date")),
+            item.get("timing"),
+            _to_float(item.get("eps_estimate")),
+            _to_float(item.get("reported_eps")),
+            _to_float(item.get("surprise_pct")),
+        )
+        for companies in data.values()
+        for company, items in companies.items()
+        for item in items
+    ]
+    if not rows:
+        return
+    # Sorting on the (symbol, date) unique key keeps index inserts sequential.
+    rows.sort(key=lambda r: (r[1], _ts_key(r[4])))
     async with db.get_pool().acquire() as conn:
-        async with conn.transaction():
-            for _day, companies in data.items():
-                for company, items in companies.items():
-                    for item in items:
-                        dt = _to_datetime(item.get("date"))
-                        await conn.execute(
-                            """
-                            INSERT INTO earnings_calendar
-                                (company, symbol, marketcap, event_name, date, timing,
-                                 eps_estimate, reported_eps, surprise_pct)
-                            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9)
-                            ON CONFLICT (symbol, date) DO UPDATE SET
-                                company = EXCLUDED.company,
-                                marketcap = COALESCE(EXCLUDED.marketcap, earnings_calendar.marketcap),
-                                event_name = COALESCE(EXCLUDED.event_name, earnings_calendar.event_name),
-                                timing = COALESCE(EXCLUDED.timing, earnings_calendar.timing),
-                                eps_estimate = COALESCE(EXCLUDED.eps_estimate, earnings_calendar.eps_estimate),
-                                reported_eps = COALESCE(EXCLUDED.reported_eps, earnings_calendar.reported_eps),
-                                surprise_pct = COALESCE(EXCLUDED.surprise_pct, earnings_calendar.surprise_pct)
-                            """,
-                            company, item.get("symbol", ""),
-                            _to_float(item.get("marketcap")),
-                            item.get("event_name"),
-                            dt,
-                            item.get("timing"),
-                            _to_float(item.get("eps_estimate")),
-                            _to_float(item.get("reported_eps")),
-                            _to_float(item.get("surprise_pct")),
-                        )
+        await conn.executemany(_UPSERT_EARNINGS_CALENDAR_SQL, rows)
+    _earnings_cache.clear()
 
 
 async def read_economics_calendar(
     start: date | None = None, end: date | None = None,
 ) -> dict[date, list[dict]]:
-    clauses = ["1=1"]
-    args: list = []
-    if start:
-        args.append(start)
-        clauses.append(f"date::date >= ${len(args)}")
-    if end:
-        args.append(end)
-        clauses.append(f"date::date <= ${len(args)}")
-    sql = (
-        "SELECT * FROM economics_calendar WHERE "
-        + " AND ".join(clauses)
-        + " ORDER BY date::date, is_all_day DESC, date, id"
-    )
+    cached = _economics_cache.get((start, end))
+    if cached is not None:
+        return cached
+
+    where, args = _date_range_filter(start, end)
+    sql = f"""
+        SELECT date::date AS day,
+               json_agg(json_build_object(
+                   'date', date,
+                   'is_all_day', is_all_day,
+                   'currency', currency,
+                   'impact', impact,
+                   'event', event,
+                   'actual', actual,
+                   'forecast', forecast,
+                   'previous', previous) ORDER BY is_all_day DESC, date, id) AS events
+        FROM economics_calendar
+        WHERE {where}
+        GROUP BY 1
+        ORDER BY 1
+    """
     async with db.get_pool().acquire() as conn:
         rows = await conn.fetch(sql, *args)
-    result: dict[date, list[dict]] = {}
-    for r in rows:
-        day = r["date"].date() if r["date"] else None
-        if day is None:
-            continue
-        item = {
-            "date": r["date"].isoformat() if r["date"] else None,
-            "is_all_day": r["is_all_day"],
-            "currency": r["currency"],
-            "impact": r["impact"],
-            "event": r["event"],
-            "actual": r["actual"],
-            "forecast": r["forecast"],
-            "previous": r["previous"],
-        }
-        result.setdefault(day, []).append(item)
+    result = {r["day"]: r["events"] for r in rows}
+    _economics_cache.set((start, end), result)
     return result
 
 
+_UPSERT_ECONOMICS_CALENDAR_SQL = """
+INSERT INTO economics_calendar
+    (date, is_all_day, currency, impact, event, actual, forecast, previous)
+VALUES ($1,$2,$3,$4,$5,$6,$7,$8)
+ON CONFLICT (date, event) DO UPDATE SET
+    is_all_day = EXCLUDED.is_all_day,
+    currency = COALESCE(EXCLUDED.currency, economics_calendar.currency),
+    impact = COALESCE(EXCLUDED.impact, economics_calendar.impact),
+    actual = COALESCE(EXCLUDED.actual, economics_calendar.actual),
+    forecast = COALESCE(EXCLUDED.forecast, economics_calendar.forecast),
+    previous = COALESCE(EXCLUDED.previous, economics_calendar.previous)
+"""
+
+
 async def write_economics_calendar(data: dict[date, list[dict]]) -> None:
+    rows = [
+        (
+            _to_datetime(ev.get("date")),
+            ev.get("is_all_day", False),
+            ev.get("currency"),
+            ev.get("impact"),
+            ev["event"],
+            ev.get("actual"),
+            ev.get("forecast"),
+            ev.get("previous"),
+        )
+        for events in data.values()
+        for ev in events
+        if ev.get("event")
+    ]
+    if not rows:
+        return
+    # Sorting on the (date, event) unique key keeps index inserts sequential.
+    rows.sort(key=lambda r: (_ts_key(r[0]), r[4]))
     async with db.get_pool().acquire() as conn:
-        async with conn.transaction():
-            for _day, events in data.items():
-                for ev in events:
-                    event_name = ev.get("event")
-                    if not event_name:
-                        continue
-                    dt = _to_datetime(ev.get("date"))
-                    await conn.execute(
-                        """
-                        INSERT INTO economics_calendar
-                            (date, is_all_day, currency, impact, event, actual, forecast, previous)
-                        VALUES ($1,$2,$3,$4,$5,$6,$7,$8)
-                        ON CONFLICT (date, event) DO UPDATE SET
-                            is_all_day = EXCLUDED.is_all_day,
-                            currency = COALESCE(EXCLUDED.currency, economics_calendar.currency),
-                            impact = COALESCE(EXCLUDED.impact, economics_calendar.impact),
-                            actual = COALESCE(EXCLUDED.actual, economics_calendar.actual),
-                            forecast = COALESCE(EXCLUDED.forecast, economics_calendar.forecast),
-                            previous = COALESCE(EXCLUDED.previous, economics_calendar.previous)
-                        """,
-                        dt,
-                        ev.get("is_all_day", False),
-                        ev.get("currency"),
-                        ev.get("impact"),
-                        event_name,
-                        ev.get("actual"),
-                        ev.get("forecast"),
-                        ev.get("previous"),
-                    )
+        await conn.executemany(_UPSERT_ECONOMICS_CALENDAR_SQL, rows)
+    _economics_cache.clear()
 
 
 # --- helpers ---
 
-def _date_str(val) -> str | None:
-    if val is None:
-        return None
-    if isinstance(val, (date, datetime)):
-        return val.isoformat()
-    return str(val)
+def _date_range_filter(start: date | None, end: date | None) -> tuple[str, list]:
+    """WHERE clause (and its args) restricting ``date`` to [start, end]."""
+    clauses = ["date IS NOT NULL"]
+    args: list = []
+    if start:
+        args.append(start)
+        clauses.append(f"date::date >= ${len(args)}")
+    if end:
+        args.append(end)
+        clauses.append(f"date::date <= ${len(args)}")
+    return " AND ".join(clauses), args
 
 
 def _to_date(val) -> date | None:
@@ -354,7 +460,14 @@ def _to_datetime(val) -> datetime | None:
         return None
 
 
+def _ts_key(val: datetime | None) -> float:
+    """Sort key for optional datetimes; tolerates mixed naive/aware values."""
+    return val.timestamp() if val is not None else float("-inf")
+
+
 def _to_float(val) -> float | None:
+    if type(val) is float:
+        return val
     if val is None:
         return None
     try: